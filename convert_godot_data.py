@@ -4,280 +4,192 @@ VeilBreakers Godot -> Unity Data Converter
 Converts .tres (Godot Resource) files to JSON for Unity
 """
 
+import functools
 import os
-import re
+import sys
 import json
+import pickle
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from tres_parser import parse_tres_file
+
+try:
+    import orjson
+except ImportError:  # optional speedup - stdlib json fallback below
+    orjson = None
+
 GODOT_PROJECT = Path(r"C:\Users\Conner\Downloads\VeilbreakersGame")
 UNITY_PROJECT = Path(r"C:\Users\Conner\Downloads\VeilBreakers3D")
 
-def parse_tres_file(filepath):
-    """Parse a Godot .tres file and extract resource data."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Find the [resource] section
-    resource_match = re.search(r'\[resource\](.*)', content, re.DOTALL)
-    if not resource_match:
-        return None
-
-    resource_content = resource_match.group(1)
-    data = {}
-
-    # Parse each line
-    lines = resource_content.strip().split('\n')
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith('#') or line.startswith('script'):
-            continue
-
-        # Match key = value
-        match = re.match(r'^(\w+)\s*=\s*(.+)$', line)
-        if match:
-            key = match.group(1)
-            value_str = match.group(2).strip()
-            data[key] = parse_value(value_str)
-
-    return data
-
-def parse_value(value_str):
-    """Parse a Godot value string to Python object."""
-    value_str = value_str.strip()
-
-    # Boolean
-    if value_str == 'true':
-        return True
-    if value_str == 'false':
-        return False
-
-    # null/nil
-    if value_str in ('null', 'nil'):
-        return None
-
-    # Color(r, g, b, a)
-    color_match = re.match(r'Color\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\)', value_str)
-    if color_match:
-        return {
-            "r": float(color_match.group(1)),
-            "g": float(color_match.group(2)),
-            "b": float(color_match.group(3)),
-            "a": float(color_match.group(4))
-        }
-
-    # Vector2
-    vec2_match = re.match(r'Vector2\(\s*([\d.-]+)\s*,\s*([\d.-]+)\s*\)', value_str)
-    if vec2_match:
-        return {"x": float(vec2_match.group(1)), "y": float(vec2_match.group(2))}
-
-    # String
-    if value_str.startswith('"') and value_str.endswith('"'):
-        return value_str[1:-1]
-
-    # Array
-    if value_str.startswith('['):
-        return parse_array(value_str)
-
-    # Dictionary
-    if value_str.startswith('{'):
-        return parse_dict(value_str)
-
-    # Integer
-    if re.match(r'^-?\d+$', value_str):
-        return int(value_str)
-
-    # Float
-    if re.match(r'^-?\d+\.\d*$', value_str):
-        return float(value_str)
-
-    return value_str
-
-def parse_array(value_str):
-    """Parse Godot array notation."""
-    try:
-        # Handle nested structures by using a more careful approach
-        content = value_str[1:-1].strip()
-        if not content:
-            return []
-
-        items = []
-        depth = 0
-        current = ""
-        in_string = False
-
-        for char in content:
-            if char == '"' and (not current or current[-1] != '\\'):
-                in_string = not in_string
-
-            if not in_string:
-                if char in '[{':
-                    depth += 1
-                elif char in ']}':
-                    depth -= 1
-                elif char == ',' and depth == 0:
-                    items.append(parse_value(current.strip()))
-                    current = ""
-                    continue
-
-            current += char
-
-        if current.strip():
-            items.append(parse_value(current.strip()))
-
-        return items
-    except:
-        return []
-
-def parse_dict(value_str):
-    """Parse Godot dictionary notation."""
+# Resource keys whose values are res:// paths needing Unity conversion
+_PATH_KEYS = {'sprite_path', 'portrait_path', 'icon_path', 'battle_sprite_path'}
+
+# Single-pass backslash -> forward slash conversion table
+_SLASH_TABLE = str.maketrans("\\", "/")
+
+# Parse cache - unchanged .tres files skip the parse pipeline entirely
+_CACHE_PATH = UNITY_PROJECT / "Assets" / "Data" / ".tres_cache.pkl"
+
+def _stem(path):
+    """Filename without extension - used as a fallback display name."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+def _load_cache():
+    """Load the parse cache mapping path -> (mtime_ns, size, data)."""
     try:
-        content = value_str[1:-1].strip()
-        if not content:
-            return {}
-
-        result = {}
-        depth = 0
-        current_key = None
-        current_val = ""
-        in_string = False
-        parsing_key = True
-
-        i = 0
-        while i < len(content):
-            char = content[i]
-
-            if char == '"' and (i == 0 or content[i-1] != '\\'):
-                in_string = not in_string
-
-            if not in_string:
-                if char in '[{':
-                    depth += 1
-                elif char in ']}':
-                    depth -= 1
-                elif char == ':' and depth == 0 and parsing_key:
-                    current_key = current_val.strip().strip('"')
-                    current_val = ""
-                    parsing_key = False
-                    i += 1
-                    continue
-                elif char == ',' and depth == 0:
-                    if current_key is not None:
-                        result[current_key] = parse_value(current_val.strip())
-                    current_key = None
-                    current_val = ""
-                    parsing_key = True
-                    i += 1
-                    continue
-
-            current_val += char
-            i += 1
-
-        if current_key is not None and current_val.strip():
-            result[current_key] = parse_value(current_val.strip())
-
-        return result
-    except:
+        with open(_CACHE_PATH, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
         return {}
 
-def convert_monsters():
-    """Convert all monster .tres files to JSON."""
-    monsters_dir = GODOT_PROJECT / "data" / "monsters"
+def _save_cache(cache):
+    """Persist the parse cache next to the JSON output."""
+    try:
+        with open(_CACHE_PATH, 'wb') as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+def _write_json(path, obj):
+    """Serialize obj to path, preferring orjson's native encoder."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, ensure_ascii=False, separators=(',', ':'), check_circular=False)
+
+def _log_converted(label, names):
+    """Emit one buffered line per category instead of a print per file."""
+    if names:
+        # display_name may parse to a non-string (e.g. a bare number)
+        sys.stdout.write(f"  Converted {label}: " + ", ".join(map(str, names)) + "\n")
+
+# Maps relative subdirectory under data/ to converter category
+_CATEGORY_BY_SUBDIR = {
+    'monsters': 'monsters',
+    'skills': 'skills',
+    'skills/monsters': 'monster_skills',
+    'heroes': 'heroes',
+    'skills/heroes': 'hero_skills',
+    'items/consumables': 'items/consumables',
+    'items/equipment': 'items/equipment',
+}
+
+def _collect_tres():
+    """Bucket every .tres file under data/ by its relative subdirectory.
+
+    One top-down os.walk replaces the per-category directory scans, so
+    each directory is listed exactly once.
+    """
+    data_dir = str(GODOT_PROJECT / "data")
+    buckets = defaultdict(list)
+    for root, _, files in os.walk(data_dir):
+        rel = os.path.relpath(root, data_dir).replace(os.sep, '/')
+        for name in files:
+            if name.endswith('.tres'):
+                buckets[rel].append(os.path.join(root, name))
+    return buckets
+
+def _gather_tres_files():
+    """Collect (category, path) pairs for every .tres file to convert."""
+    buckets = _collect_tres()
+    pairs = []
+    for subdir, category in _CATEGORY_BY_SUBDIR.items():
+        for tres_path in sorted(buckets.get(subdir, ())):
+            pairs.append((category, tres_path))
+    return pairs
+
+def convert_monsters(parsed):
+    """Convert parsed monster resources to JSON-ready dicts."""
     output = []
 
-    for tres_file in monsters_dir.glob("*.tres"):
-        data = parse_tres_file(tres_file)
-        if data:
-            # Convert sprite paths from Godot to Unity format
-            if 'sprite_path' in data:
-                data['sprite_path'] = convert_path(data['sprite_path'])
-            if 'portrait_path' in data:
-                data['portrait_path'] = convert_path(data['portrait_path'])
-            output.append(data)
-            print(f"  Converted monster: {data.get('display_name', tres_file.stem)}")
+    log = []
+    for tres_file, data in parsed:
+        # Convert sprite paths from Godot to Unity format
+        for key in _PATH_KEYS & data.keys():
+            data[key] = convert_path(data[key])
+        output.append(data)
+        log.append(data.get('display_name', _stem(tres_file)))
+    _log_converted("monsters", log)
 
     return output
 
-def convert_skills():
-    """Convert all skill .tres files to JSON."""
-    skills_dir = GODOT_PROJECT / "data" / "skills"
+def convert_skills(parsed, monster_parsed):
+    """Convert parsed skill resources to JSON-ready dicts."""
     output = []
 
     # Main skills
-    for tres_file in skills_dir.glob("*.tres"):
-        data = parse_tres_file(tres_file)
-        if data:
-            if 'icon_path' in data:
-                data['icon_path'] = convert_path(data['icon_path'])
-            output.append(data)
-            print(f"  Converted skill: {data.get('display_name', tres_file.stem)}")
+    log = []
+    for tres_file, data in parsed:
+        for key in _PATH_KEYS & data.keys():
+            data[key] = convert_path(data[key])
+        output.append(data)
+        log.append(data.get('display_name', _stem(tres_file)))
+    _log_converted("skills", log)
 
     # Monster skills
-    monster_skills_dir = skills_dir / "monsters"
-    if monster_skills_dir.exists():
-        for tres_file in monster_skills_dir.glob("*.tres"):
-            data = parse_tres_file(tres_file)
-            if data:
-                data['is_monster_skill'] = True
-                if 'icon_path' in data:
-                    data['icon_path'] = convert_path(data['icon_path'])
-                output.append(data)
-                print(f"  Converted monster skill: {data.get('display_name', tres_file.stem)}")
+    log = []
+    for tres_file, data in monster_parsed:
+        data['is_monster_skill'] = True
+        for key in _PATH_KEYS & data.keys():
+            data[key] = convert_path(data[key])
+        output.append(data)
+        log.append(data.get('display_name', _stem(tres_file)))
+    _log_converted("monster skills", log)
 
     return output
 
-def convert_heroes():
-    """Convert all hero .tres files to JSON."""
-    heroes_dir = GODOT_PROJECT / "data" / "heroes"
+def convert_heroes(parsed, skill_parsed):
+    """Convert parsed hero resources to JSON-ready dicts."""
     output = []
 
-    for tres_file in heroes_dir.glob("*.tres"):
-        data = parse_tres_file(tres_file)
-        if data:
-            for path_key in ['sprite_path', 'portrait_path', 'battle_sprite_path']:
-                if path_key in data:
-                    data[path_key] = convert_path(data[path_key])
-            output.append(data)
-            print(f"  Converted hero: {data.get('display_name', tres_file.stem)}")
+    log = []
+    for tres_file, data in parsed:
+        for key in _PATH_KEYS & data.keys():
+            data[key] = convert_path(data[key])
+        output.append(data)
+        log.append(data.get('display_name', _stem(tres_file)))
+    _log_converted("heroes", log)
 
-    # Also check nested heroes folder in skills
-    heroes_dir2 = GODOT_PROJECT / "data" / "skills" / "heroes"
-    if heroes_dir2.exists():
-        for tres_file in heroes_dir2.glob("*.tres"):
-            data = parse_tres_file(tres_file)
-            if data:
-                output.append(data)
-                print(f"  Converted hero skill: {data.get('display_name', tres_file.stem)}")
+    log = []
+    for tres_file, data in skill_parsed:
+        output.append(data)
+        log.append(data.get('display_name', _stem(tres_file)))
+    _log_converted("hero skills", log)
 
     return output
 
-def convert_items():
-    """Convert all item .tres files to JSON."""
-    items_dir = GODOT_PROJECT / "data" / "items"
+def convert_items(consumables, equipment):
+    """Convert parsed item resources to JSON-ready dicts."""
     output = []
 
-    for subdir in ['consumables', 'equipment']:
-        subpath = items_dir / subdir
-        if subpath.exists():
-            for tres_file in subpath.glob("*.tres"):
-                data = parse_tres_file(tres_file)
-                if data:
-                    data['item_category'] = subdir
-                    if 'icon_path' in data:
-                        data['icon_path'] = convert_path(data['icon_path'])
-                    output.append(data)
-                    print(f"  Converted item: {data.get('display_name', tres_file.stem)}")
+    for subdir, parsed in (('consumables', consumables), ('equipment', equipment)):
+        log = []
+        for tres_file, data in parsed:
+            data['item_category'] = subdir
+            for key in _PATH_KEYS & data.keys():
+                data[key] = convert_path(data[key])
+            output.append(data)
+            log.append(data.get('display_name', _stem(tres_file)))
+        _log_converted(subdir, log)
 
     return output
 
+@functools.lru_cache(maxsize=4096)
 def convert_path(godot_path):
-    """Convert Godot res:// path to Unity-friendly path."""
+    """Convert Godot res:// path to Unity-friendly path.
+
+    Cached - the same spritesheet/icon paths are shared by many records.
+    """
     if not godot_path:
         return ""
     # Remove res:// prefix and convert to relative Unity path
-    path = godot_path.replace("res://", "")
-    # Convert to forward slashes
-    path = path.replace("\\", "/")
-    return path
+    path = godot_path[6:] if godot_path.startswith("res://") else godot_path
+    # Convert to forward slashes in one C-level pass
+    return path.translate(_SLASH_TABLE)
 
 def main():
     """Main conversion routine."""
@@ -290,32 +202,60 @@ def main():
     output_dir = UNITY_PROJECT / "Assets" / "Data"
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    pairs = _gather_tres_files()
+
+    # Reuse cached parses for files whose mtime and size are unchanged;
+    # only misses pay for the parse pipeline
+    cache = _load_cache()
+    results = [None] * len(pairs)
+    misses = []
+    for idx, (category, tres_path) in enumerate(pairs):
+        st = os.stat(tres_path)
+        hit = cache.get(tres_path)
+        if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            results[idx] = hit[2]
+        else:
+            misses.append((idx, tres_path, st))
+
+    # Parse changed files across all cores - parse_tres_file is a pure
+    # function of its path, so nothing else crosses the process boundary
+    if misses:
+        with ProcessPoolExecutor() as executor:
+            fresh = list(executor.map(parse_tres_file, [p for _, p, _ in misses], chunksize=16))
+        for (idx, tres_path, st), data in zip(misses, fresh):
+            results[idx] = data
+            cache[tres_path] = (st.st_mtime_ns, st.st_size, data)
+
+    # Persist before the converters mutate the parsed dicts in place
+    _save_cache(cache)
+
+    parsed = defaultdict(list)
+    for (category, tres_file), data in zip(pairs, results):
+        if data:
+            parsed[category].append((tres_file, data))
+
     # Convert monsters
     print("\n[MONSTERS]")
-    monsters = convert_monsters()
-    with open(output_dir / "monsters.json", 'w', encoding='utf-8') as f:
-        json.dump(monsters, f, indent=2)
+    monsters = convert_monsters(parsed["monsters"])
+    _write_json(output_dir / "monsters.json", monsters)
     print(f"  Total: {len(monsters)} monsters")
 
     # Convert skills
     print("\n[SKILLS]")
-    skills = convert_skills()
-    with open(output_dir / "skills.json", 'w', encoding='utf-8') as f:
-        json.dump(skills, f, indent=2)
+    skills = convert_skills(parsed["skills"], parsed["monster_skills"])
+    _write_json(output_dir / "skills.json", skills)
     print(f"  Total: {len(skills)} skills")
 
     # Convert heroes
     print("\n[HEROES]")
-    heroes = convert_heroes()
-    with open(output_dir / "heroes.json", 'w', encoding='utf-8') as f:
-        json.dump(heroes, f, indent=2)
+    heroes = convert_heroes(parsed["heroes"], parsed["hero_skills"])
+    _write_json(output_dir / "heroes.json", heroes)
     print(f"  Total: {len(heroes)} heroes")
 
     # Convert items
     print("\n[ITEMS]")
-    items = convert_items()
-    with open(output_dir / "items.json", 'w', encoding='utf-8') as f:
-        json.dump(items, f, indent=2)
+    items = convert_items(parsed["items/consumables"], parsed["items/equipment"])
+    _write_json(output_dir / "items.json", items)
     print(f"  Total: {len(items)} items")
 
     print("\n" + "=" * 60)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Godot .tres parser for the VeilBreakers data converter.
+
+Self-contained and fully annotated so it can optionally be AOT-compiled
+(`python -m mypyc tres_parser.py`); convert_godot_data.py imports the
+same API whether the compiled extension is present or not.
+"""
+
+import functools
+import re
+import sys
+from typing import Dict, List, Optional, Tuple, Union
+
+# Precompiled patterns - avoids re's internal cache lookup on every value
+_COLOR_RE = re.compile(r'Color\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\)')
+_VEC2_RE = re.compile(r'Vector2\(\s*([\d.-]+)\s*,\s*([\d.-]+)\s*\)')
+_STRUCT_RE = re.compile(r'["\[\]{},:]')
+
+def parse_tres_file(filepath: str) -> Optional[dict]:
+    """Parse a Godot .tres file and extract resource data."""
+    data: dict = {}
+    in_resource = False
+
+    # Stream the file instead of slurping it - lines before [resource]
+    # (ext_resource/sub_resource blocks) are skipped without any parsing
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not in_resource:
+                if line == '[resource]':
+                    in_resource = True
+                continue
+            if not line or line.startswith('#') or line.startswith('script'):
+                continue
+
+            # Split key = value - the key is always a plain identifier, so
+            # find/isidentifier beat a regex match here
+            eq = line.find('=')
+            if eq < 0:
+                continue
+            key = line[:eq].rstrip()
+            if not key.isidentifier():
+                continue
+            value_str = line[eq + 1:].lstrip()
+            if value_str:
+                # Intern the key - the same handful of field names repeat
+                # across every resource, so one canonical str is shared
+                data[sys.intern(key)] = parse_value(value_str)
+
+    if not in_resource:
+        return None
+    return data
+
+def parse_value(value_str: str) -> object:
+    """Parse a Godot value string to Python object.
+
+    Callers pass tokens already trimmed of surrounding whitespace, so no
+    second strip happens here.
+    """
+    # First-character dispatch - the regex engine only runs for values
+    # that can actually be a Color/Vector2 constructor
+    c0 = value_str[:1]
+
+    # Containers return fresh mutable objects, so they bypass the cache
+    if c0 == '[' or c0 == '{':
+        return _parse_container(value_str)
+
+    return _parse_leaf(value_str)
+
+def _parse_leaf(value_str: str) -> object:
+    """Parse a non-container token (scalar or Color/Vector2 constructor)."""
+    c0 = value_str[:1]
+
+    if c0 == 'C':
+        # Color(r, g, b, a) -> [r, g, b, a] - a tuple serializes as a JSON
+        # array and is far cheaper than a 4-key dict per color
+        color_match = _COLOR_RE.match(value_str)
+        if color_match:
+            return (
+                float(color_match.group(1)),
+                float(color_match.group(2)),
+                float(color_match.group(3)),
+                float(color_match.group(4))
+            )
+    elif c0 == 'V':
+        # Vector2(x, y) -> [x, y]
+        vec2_match = _VEC2_RE.match(value_str)
+        if vec2_match:
+            return (float(vec2_match.group(1)), float(vec2_match.group(2)))
+
+    return _parse_scalar(value_str)
+
+@functools.lru_cache(maxsize=8192)
+def _parse_scalar(value_str: str) -> object:
+    """Parse an immutable scalar token.
+
+    The same literals (true/false, small ints, enum names, res:// paths)
+    repeat across hundreds of .tres files, so results are memoized.
+    """
+    # Boolean
+    if value_str == 'true':
+        return True
+    if value_str == 'false':
+        return False
+
+    # null/nil
+    if value_str in ('null', 'nil'):
+        return None
+
+    # String
+    if value_str.startswith('"') and value_str.endswith('"'):
+        return value_str[1:-1]
+
+    # Integer - str.isdecimal is a C builtin, much cheaper than a regex
+    # match, and unlike isdigit it accepts exactly the characters int() does
+    digits = value_str[1:] if value_str[:1] == '-' else value_str
+    if digits.isdecimal():
+        return int(value_str)
+
+    # Float - only attempt the conversion if it looks like one
+    if '.' in value_str:
+        try:
+            return float(value_str)
+        except ValueError:
+            pass
+
+    return value_str
+
+def _parse_container(s: str) -> object:
+    """Parse nested array/dict notation iteratively.
+
+    One explicit stack of (container, pending_key) frames replaces the
+    old recursion through parse_value, so deeply nested values cost no
+    extra Python call frames and cannot hit the recursion limit.
+    Structural characters are located with a compiled regex search and
+    quoted strings are hopped over with str.find, so each scalar token
+    comes from one C-level slice.
+    """
+    try:
+        stack: List[Tuple[Union[List[object], Dict[str, object]], Optional[str]]] = []
+        container: Union[List[object], Dict[str, object], None] = None
+        pending_key: Optional[str] = None
+        token_start = 0
+        i = 0
+        n = len(s)
+
+        while i < n:
+            match = _STRUCT_RE.search(s, i)
+            if match is None:
+                break
+            i = match.start()
+            char = s[i]
+
+            if char == '"':
+                # Jump straight to the closing quote, skipping escaped
+                # ones. A quote preceded by an escaped backslash (\\")
+                # still closes the string - only a lone backslash escapes.
+                j = s.find('"', i + 1)
+                while j != -1 and s[j - 1] == '\\' and s[j - 2:j] != '\\\\':
+                    j = s.find('"', j + 1)
+                if j == -1:
+                    break
+                i = j + 1
+                continue
+
+            if char == '[' or char == '{':
+                if container is not None:
+                    stack.append((container, pending_key))
+                container = [] if char == '[' else {}
+                pending_key = None
+                token_start = i + 1
+            elif char == ':':
+                # Key/value separator - only meaningful inside a dict
+                # still waiting for its key; elsewhere the colon is part
+                # of the token (e.g. res:// paths)
+                if isinstance(container, dict) and pending_key is None:
+                    token = s[token_start:i].strip()
+                    if token:
+                        pending_key = sys.intern(token.strip('"'))
+                    token_start = i + 1
+            elif char == ',':
+                token = s[token_start:i].strip()
+                if token:
+                    value = _parse_leaf(token)
+                    if isinstance(container, list):
+                        container.append(value)
+                    elif isinstance(container, dict) and pending_key is not None:
+                        container[pending_key] = value
+                        pending_key = None
+                token_start = i + 1
+            else:  # ']' or '}'
+                token = s[token_start:i].strip()
+                if token:
+                    value = _parse_leaf(token)
+                    if isinstance(container, list):
+                        container.append(value)
+                    elif isinstance(container, dict) and pending_key is not None:
+                        container[pending_key] = value
+                        pending_key = None
+                token_start = i + 1
+                if not stack:
+                    return container
+                finished = container
+                container, pending_key = stack.pop()
+                if isinstance(container, list):
+                    container.append(finished)
+                elif isinstance(container, dict) and pending_key is not None:
+                    container[pending_key] = finished
+                    pending_key = None
+            i += 1
+
+        # Unterminated container - flush the trailing token and return
+        # whatever was built so far
+        if container is not None:
+            token = s[token_start:n].strip()
+            if token:
+                value = _parse_leaf(token)
+                if isinstance(container, list):
+                    container.append(value)
+                elif isinstance(container, dict) and pending_key is not None:
+                    container[pending_key] = value
+            return container
+        return [] if s[:1] == '[' else {}
+    except:
+        return [] if s[:1] == '[' else {}